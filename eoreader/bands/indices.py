@@ -21,10 +21,11 @@ Set of usual spectral indices.
 """
 # Index not snake case
 # pylint: disable=C0103
+import ast
 import inspect
 import logging
-import re
-import sys
+import textwrap
+from contextlib import contextmanager
 from functools import wraps
 from typing import Callable
 
@@ -89,9 +90,13 @@ EOREADER_DERIVATIVES = {
 }
 
 
+# EOReader index functions, as {index_name: function}, registered by the _idx_fct decorator
+EOREADER_INDICES = {}
+
+
 def _idx_fct(function: Callable) -> Callable:
     """
-    Decorator of index functions
+    Decorator of index functions (registers them in :code:`EOREADER_INDICES`)
     """
 
     @wraps(function)
@@ -104,20 +109,38 @@ def _idx_fct(function: Callable) -> Callable:
         Returns:
             xr.DataArray: Computed index
         """
-        out_np = function({key: val for key, val in bands.items()})
+        out_np = function(bands)
 
-        # Take the first band as a template for xarray
-        first_xda = list(bands.values())[0]
-        out_xda = first_xda.copy(data=out_np)
+        # Keep the underlying array (lazy if the bands are dask-backed) instead of converting it to numpy
+        if isinstance(out_np, xr.DataArray):
+            out_np = out_np.data
 
-        out = rasters.set_metadata(out_xda, first_xda, new_name=str(function.__name__))
-        return out
+        return _set_index_metadata(out_np, bands, str(function.__name__))
 
+    EOREADER_INDICES[function.__name__] = _idx_fct_wrapper
     return _idx_fct_wrapper
 
 
-def compute_index(index: str, bands: dict, **kwargs) -> xr.DataArray:
+def _to_float32(bands: dict) -> dict:
+    """
+    Convert bands to float32 (halves the memory bandwidth compared to float64).
+    Bands already in float32 are kept as is.
+
+    Args:
+        bands (dict): Band dictionary
+
+    Returns:
+        dict: Band dictionary in float32
+    """
+    return {
+        key: val if val.dtype == np.float32 else val.astype(np.float32)
+        for key, val in bands.items()
+    }
+
+
+def _compute_index_data(index: str, bands: dict, **kwargs):
     """
+    Compute the index array, without any metadata
 
     Args:
         index (str): Index name (as a string)
@@ -125,7 +148,7 @@ def compute_index(index: str, bands: dict, **kwargs) -> xr.DataArray:
         **kwargs: Kwargs
 
     Returns:
-        xr.DataArray: Computed index
+        Computed index as an array (numpy or dask)
     """
 
     def _compute_params(_bands, **_kwargs):
@@ -164,17 +187,182 @@ def compute_index(index: str, bands: dict, **kwargs) -> xr.DataArray:
         }
         index_arr = spyndex.computeIndex(idx_name, params)
     else:
-        index_arr = eval(index)(bands)
+        # Metadata is set afterwards, call the bare index function
+        index_arr = EOREADER_INDICES[index].__wrapped__(bands)
+
+    if isinstance(index_arr, xr.DataArray):
+        index_arr = index_arr.data
+
+    return index_arr
+
 
+def _set_index_metadata(index_arr, bands: dict, index: str) -> xr.DataArray:
+    """
+    Convert an index array to xarray, with the metadata of the first band
+
+    Args:
+        index_arr: Computed index as an array (numpy or dask)
+        bands (dict): Band dictionary
+        index (str): Index name (as a string)
+
+    Returns:
+        xr.DataArray: Computed index
+    """
     # TODO: check if metadata is kept with spyndex
 
     # Take the first band as a template for xarray
+    # (building a new DataArray is cheaper than copying the first one)
     first_xda = list(bands.values())[0]
-    out_xda = first_xda.copy(data=index_arr)
+    out_xda = xr.DataArray(
+        index_arr,
+        dims=first_xda.dims,
+        coords=first_xda.coords,
+        attrs=dict(first_xda.attrs),
+        name=index,
+    )
 
     return rasters.set_metadata(out_xda, first_xda, new_name=index)
 
 
+def compute_index(index: str, bands: dict, **kwargs) -> xr.DataArray:
+    """
+
+    Args:
+        index (str): Index name (as a string)
+        bands (dict): Band dictionary
+        **kwargs: Kwargs
+
+    Returns:
+        xr.DataArray: Computed index
+    """
+    bands = _to_float32(bands)
+    return _set_index_metadata(
+        _compute_index_data(index, bands, **kwargs), bands, index
+    )
+
+
+def compute_indices(indices: list, bands: dict, **kwargs) -> dict:
+    """
+    Compute several indices at once.
+
+    If the bands are dask arrays, all the indices are computed block by block in one pass
+    (each block of the bands being read only once for all the indices) and are then persisted.
+    Intermediate results shared by several indices are only computed once.
+
+    Args:
+        indices (list): Index names (as strings)
+        bands (dict): Band dictionary
+        **kwargs: Kwargs
+
+    Returns:
+        dict: Computed indices as {index_name: xr.DataArray}
+    """
+    with _index_batch():
+        return _compute_indices(indices, _to_float32(bands), **kwargs)
+
+
+def _compute_indices(indices: list, bands: dict, **kwargs) -> dict:
+    """
+    Compute several indices at once (see :code:`compute_indices`)
+
+    Args:
+        indices (list): Index names (as strings)
+        bands (dict): Band dictionary (in float32)
+        **kwargs: Kwargs
+
+    Returns:
+        dict: Computed indices as {index_name: xr.DataArray}
+    """
+    first_xda = list(bands.values())[0]
+    if first_xda.chunks is None or len(indices) < 2:
+        return {index: compute_index(index, bands, **kwargs) for index in indices}
+
+    import dask.array as da
+
+    band_names = list(bands.keys())
+    band_stack = da.stack([bands[band].data for band in band_names]).rechunk({0: -1})
+
+    def _compute_block(block: np.ndarray) -> np.ndarray:
+        block_bands = {
+            band: xr.DataArray(block[i]) for i, band in enumerate(band_names)
+        }
+        return np.stack(
+            [
+                np.asarray(_compute_index_data(index, block_bands, **kwargs))
+                for index in indices
+            ]
+        ).astype(np.float32, copy=False)
+
+    idx_stack = band_stack.map_blocks(
+        _compute_block,
+        chunks=((len(indices),),) + band_stack.chunks[1:],
+        dtype=np.float32,
+    ).persist()
+
+    return {
+        index: _set_index_metadata(idx_stack[i], bands, index)
+        for i, index in enumerate(indices)
+    }
+
+
+# Intermediate results shared by the indices computed in the current batch, as {kind: (inputs, result)}
+# Only the last result of each kind is kept. None outside of a batch (see _index_batch)
+_batch_cache = None
+
+
+@contextmanager
+def _index_batch():
+    """
+    Context manager sharing intermediate results (i.e. Tasseled Cap components or normalized differences)
+    between the indices computed inside it.
+
+    The cached results (and the bands they reference) are released when exiting the outermost batch.
+    """
+    global _batch_cache
+    previous_cache = _batch_cache
+    if previous_cache is None:
+        _batch_cache = {}
+    try:
+        yield
+    finally:
+        _batch_cache = previous_cache
+
+
+def _get_batch_cache(kind: str, inputs: tuple):
+    """
+    Get the intermediate result cached in the current batch for these inputs
+
+    Args:
+        kind (str): Kind of intermediate result
+        inputs (tuple): Inputs of the intermediate result (compared by identity)
+
+    Returns:
+        The cached result, or None if nothing is cached for these inputs
+    """
+    # Read the cache only once, indices can be computed in parallel in dask blocks
+    cached = _batch_cache.get(kind) if _batch_cache is not None else None
+    if cached is not None and all(
+        cached_input is curr_input for cached_input, curr_input in zip(cached[0], inputs)
+    ):
+        return cached[1]
+
+    return None
+
+
+def _set_batch_cache(kind: str, inputs: tuple, result) -> None:
+    """
+    Cache an intermediate result in the current batch (does nothing outside of a batch)
+
+    Args:
+        kind (str): Kind of intermediate result
+        inputs (tuple): Inputs of the intermediate result (kept to be compared by identity)
+        result: Intermediate result
+    """
+    cache = _batch_cache
+    if cache is not None:
+        cache[kind] = (inputs, result)
+
+
 def _norm_diff(band_1: xr.DataArray, band_2: xr.DataArray) -> xr.DataArray:
     """
     Get normalized difference index between band 1 and band 2:
@@ -187,10 +375,52 @@ def _norm_diff(band_1: xr.DataArray, band_2: xr.DataArray) -> xr.DataArray:
     Returns:
         xr.DataArray: Normalized Difference between band 1 and band 2
     """
-    norm = (band_1 - band_2) / (band_1 + band_2)
+    norm = _get_batch_cache("norm_diff", (band_1, band_2))
+    if norm is None:
+        # Divide in place: only one temporary is allocated on top of the output
+        norm = band_1 - band_2
+        norm /= band_1 + band_2
+        _set_batch_cache("norm_diff", (band_1, band_2), norm)
+
     return norm
 
 
+# Tasseled Cap coefficients, rows: brightness, greenness, wetness
+TC_BANDS = [BLUE, GREEN, RED, NIR, SWIR_1, SWIR_2]
+TC_COEFFS = np.array(
+    [
+        [0.3037, 0.2793, 0.4743, 0.5585, 0.5082, 0.1863],
+        [-0.2848, -0.2435, -0.5436, 0.7243, 0.0840, -0.1800],
+        [0.1509, 0.1973, 0.3279, 0.3406, -0.7112, -0.4572],
+    ],
+    dtype=np.float32,
+)
+
+
+def _tasseled_cap(bands: dict) -> np.ndarray:
+    """
+    Compute the three Tasseled Cap components (brightness, greenness and wetness) in one pass,
+    as a single matrix product between the coefficients and the stacked bands.
+
+    The result is cached in the current batch (see :code:`_index_batch`) so that asking for TCBRI, TCGRE and TCWET together
+    only reads the bands once.
+
+    Args:
+        bands (dict): Bands as {band_name: xr.DataArray}
+
+    Returns:
+        np.ndarray: Tasseled Cap components stacked along the first axis (brightness, greenness, wetness)
+    """
+    tc_bands = tuple(bands[band] for band in TC_BANDS)
+    tc = _get_batch_cache("tasseled_cap", tc_bands)
+    if tc is None:
+        stack = np.stack([band.data for band in tc_bands])
+        tc = np.tensordot(TC_COEFFS, stack, axes=1)
+        _set_batch_cache("tasseled_cap", tc_bands, tc)
+
+    return tc
+
+
 @_idx_fct
 def TCBRI(bands: dict) -> xr.DataArray:
     """
@@ -206,14 +436,7 @@ def TCBRI(bands: dict) -> xr.DataArray:
         xr.DataArray: Computed index
 
     """
-    return (
-        0.3037 * bands[BLUE]
-        + 0.2793 * bands[GREEN]
-        + 0.4743 * bands[RED]
-        + 0.5585 * bands[NIR]
-        + 0.5082 * bands[SWIR_1]
-        + 0.1863 * bands[SWIR_2]
-    )
+    return _tasseled_cap(bands)[0]
 
 
 @_idx_fct
@@ -231,14 +454,7 @@ def TCGRE(bands: dict) -> xr.DataArray:
         xr.DataArray: Computed index
 
     """
-    return (
-        -0.2848 * bands[BLUE]
-        - 0.2435 * bands[GREEN]
-        - 0.5436 * bands[RED]
-        + 0.7243 * bands[NIR]
-        + 0.0840 * bands[SWIR_1]
-        - 0.1800 * bands[SWIR_2]
-    )
+    return _tasseled_cap(bands)[1]
 
 
 @_idx_fct
@@ -256,14 +472,7 @@ def TCWET(bands: dict) -> xr.DataArray:
         xr.DataArray: Computed index
 
     """
-    return (
-        0.1509 * bands[BLUE]
-        + 0.1973 * bands[GREEN]
-        + 0.3279 * bands[RED]
-        + 0.3406 * bands[NIR]
-        - 0.7112 * bands[SWIR_1]
-        - 0.4572 * bands[SWIR_2]
-    )
+    return _tasseled_cap(bands)[2]
 
 
 @_idx_fct
@@ -282,7 +491,11 @@ def SCI(bands: dict) -> xr.DataArray:
     Returns:
         xr.DataArray: Computed index
     """
-    return 3 * bands[GREEN] - bands[RED] - 100
+    # Compute in place to avoid allocating one temporary per operation
+    sci = 3 * bands[GREEN]
+    sci -= bands[RED]
+    sci -= 100
+    return sci
 
 
 def get_all_index_names() -> list:
@@ -309,14 +522,7 @@ def get_eoreader_indices() -> list:
     Returns:
         list: list of all EOReader indices
     """
-    eoreader_indices = []
-
-    functions = inspect.getmembers(sys.modules[__name__], predicate=inspect.isfunction)
-
-    for name, fct in functions:
-        # Do not gather this fct nor da.true_divide
-        if name[0].isupper():
-            eoreader_indices.append(fct.__name__)
+    eoreader_indices = sorted(EOREADER_INDICES)
 
     # Add aliases
     for eoreader_idx, spyndex_idx in DEPRECATED_SPECTRAL_INDICES.items():
@@ -372,6 +578,48 @@ assert not any(is_spyndex_idx(alias) for alias in DEPRECATED_SPECTRAL_INDICES.ke
 assert not any(is_spyndex_idx(alias) for alias in EOREADER_DERIVATIVES.keys())
 
 
+# Needed bands of EOReader index functions, as {function qualified name: bands}
+_NEEDED_BANDS_CACHE = {}
+
+
+def _get_eoreader_idx_bands(index_fct: Callable) -> list:
+    """
+    Gather the needed bands of an EOReader index function by walking its syntax tree.
+
+    Band names (or lists of band names) referenced in the function are gathered,
+    along with the ones referenced in the helpers of this module called by the function.
+
+    Args:
+        index_fct (Callable): EOReader index function (or one of its helpers)
+
+    Returns:
+        list: Needed bands for the index function
+    """
+    name = index_fct.__qualname__
+    if name not in _NEEDED_BANDS_CACHE:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(index_fct)))
+
+        needed_bands = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+                helper = globals().get(node.func.id)
+                if inspect.isfunction(helper) and helper.__module__ == __name__:
+                    needed_bands += _get_eoreader_idx_bands(helper)
+            elif isinstance(node, ast.Name):
+                value = globals().get(node.id)
+                if isinstance(value, SpectralBandNames):
+                    needed_bands.append(value)
+                elif isinstance(value, list) and all(
+                    isinstance(val, SpectralBandNames) for val in value
+                ):
+                    needed_bands += value
+
+        # Remove duplicates but keep the order
+        _NEEDED_BANDS_CACHE[name] = list(dict.fromkeys(needed_bands))
+
+    return _NEEDED_BANDS_CACHE[name]
+
+
 def get_needed_bands(index: str) -> list:
     """
     Gather all the needed bands for the specified index function
@@ -396,16 +644,7 @@ def get_needed_bands(index: str) -> list:
                 ).bands
             ]
         else:
-            # Get source code from this fct
-            code = inspect.getsource(eval(index))
-
-            # Parse band's signature
-            b_regex = r"spb\.\w+"
-
-            return [
-                getattr(SpectralBandNames, b.split(".")[-1])
-                for b in re.findall(b_regex, code)
-            ]
+            return _get_eoreader_idx_bands(EOREADER_INDICES[index])
     elif is_spyndex_idx(index):
         # Don't need gamma etc.
         return [
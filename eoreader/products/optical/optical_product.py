@@ -351,7 +351,11 @@ class OpticalProduct(Product):
                     #     )
                     # Negative reflectances should be discarded: https://labo.obs-mip.fr/multitemp/can-surface-reflectance-be-negative
                     # NB: Reflectances > 1 are valid, see https://forum.step.esa.int/t/toa-range-in-sentinel-2-images-between-0-an-1/3168
-                    band_arr = band_arr.clip(min=0, keep_attrs=True)
+                    if isinstance(band_arr.data, np.ndarray):
+                        # Clip in place to avoid allocating a new array (keeps NaNs)
+                        np.maximum(band_arr.data, 0, out=band_arr.data)
+                    else:
+                        band_arr = band_arr.clip(min=0, keep_attrs=True)
 
                 # Write on disk
                 try:
@@ -55,7 +55,7 @@ from eoreader.bands import (
     NEEDED_BANDS,
     SLOPE,
     BandNames,
-    compute_index,
+    compute_indices,
     indices,
     is_clouds,
     is_dem,
@@ -1097,6 +1097,7 @@ class Product:
             dict: Dictionary {band_name, band_xarray}
         """
         band_dict = {}
+        idx_to_compute = []
         for idx in index_list:
             idx_path = self._construct_band_path(
                 idx, pixel_size, size, writable=False, **kwargs
@@ -1104,7 +1105,13 @@ class Product:
             if idx_path.is_file():
                 band_dict[idx] = utils.read(idx_path)
             else:
-                idx_arr = compute_index(index=idx, bands=loaded_bands).rename(idx)
+                idx_to_compute.append(idx)
+
+        # Compute all the missing indices at once
+        if idx_to_compute:
+            computed_idx = compute_indices(indices=idx_to_compute, bands=loaded_bands)
+            for idx, idx_arr in computed_idx.items():
+                idx_arr = idx_arr.rename(idx)
                 idx_arr.attrs["long_name"] = idx
 
                 # Write on disk
@@ -1114,7 +1121,8 @@ class Product:
                 utils.write(idx_arr, idx_path)
                 band_dict[idx] = idx_arr
 
-        return band_dict
+        # Keep the asked order
+        return {idx: band_dict[idx] for idx in index_list}
 
     def _load_dem(
         self,
@@ -367,6 +367,33 @@ def simplify(footprint_fct: Callable):
     return simplify_wrapper
 
 
+def _nanpercentile_lower_bound(arr, q: float, bins: int = 4096) -> float:
+    """
+    Approximate the q-th percentile of an array (ignoring NaNs) with a histogram,
+    which only needs linear passes over the data instead of a partial sort.
+
+    The left edge of the bin containing the percentile is returned,
+    so the result is never greater than the exact percentile (the error being at most one bin width).
+
+    Args:
+        arr: Array (numpy or dask)
+        q (float): Percentile, in [0, 100]
+        bins (int): Number of bins of the histogram
+
+    Returns:
+        float: Lower bound of the q-th percentile
+    """
+    vmin = float(np.nanmin(arr))
+    vmax = float(np.nanmax(arr))
+    if np.isnan(vmin) or vmin == vmax:
+        return vmin
+
+    # NaNs are outside the range and are therefore not counted
+    hist, edges = np.histogram(arr, bins=bins, range=(vmin, vmax))
+    cdf = np.cumsum(np.asarray(hist))
+    return float(edges[np.searchsorted(cdf, q / 100 * cdf[-1])])
+
+
 def stack_dict(
     bands: list, band_xds: xr.Dataset, save_as_int: bool, nodata: float, **kwargs
 ) -> (xr.DataArray, type):
@@ -411,10 +438,7 @@ def stack(
         scale = 10000
         round_nb = 1000
         round_min = -0.1
-        try:
-            stack_min = float(band_xds.to_array().quantile(0.001))
-        except ValueError:
-            stack_min = np.nanpercentile(band_xds.to_array(), 1)
+        stack_min = _nanpercentile_lower_bound(band_xds.to_array().data, 0.1)
 
         if np.round(stack_min * round_nb) / round_nb < round_min:
             LOGGER.warning(